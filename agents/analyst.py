@@ -1,46 +1,60 @@
-from autogen import AssistantAgent, UserProxyAgent
-from pathlib import Path
-from autogen.coding import LocalCommandLineCodeExecutor
-from agents.llm_configs import AnalystConfig  # Import the AnalystConfig
+from functools import lru_cache
 
-# Setting up the code executor
-workdir = Path("coding")
-workdir.mkdir(exist_ok=True)
-code_executor = LocalCommandLineCodeExecutor(work_dir=workdir)
+from agents.code_executor import get_code_executor
+from agents.http_pool import get_client
+from agents.llm_configs import AnalystConfig  # Import the AnalystConfig
 
-class AnalystAgent:
-    def __init__(self, name: str, focus: str):
-        self.agent = AssistantAgent(
-            name=name,
-            system_message=f"""
+_SYSTEM_MESSAGE_TEMPLATE = """
             You are an expert financial analyst focusing on {focus}. Analyze the provided data and provide a summary.
             Focus on:
             1. Key insights
             2. Current market position
             3. Potential risks and opportunities
             
-            Provide clear, actionable insights based on your analysis.""",
+            Provide clear, actionable insights based on your analysis."""
+
+
+@lru_cache(maxsize=None)
+def _system_message(focus: str) -> str:
+    """Return the system message for an analyst with the given focus."""
+    return _SYSTEM_MESSAGE_TEMPLATE.format(focus=focus)
+
+
+def _always_terminate(msg: dict) -> bool:
+    """Automatically proceed without waiting for input."""
+    return True
+
+
+class AnalystAgent:
+    def __init__(self, name: str, focus: str):
+        from autogen import AssistantAgent, UserProxyAgent  # Deferred, autogen is slow to import
+
+        self.agent = AssistantAgent(
+            name=name,
+            system_message=_system_message(focus),
             llm_config={
                 "config_list": [{
                     "model": AnalystConfig.LLM_MODEL,
                     "base_url": AnalystConfig.BASE_URL,
                     "api_key": AnalystConfig.API_KEY,
+                    "http_client": get_client(),  # Shared keep-alive connection pool
                 }],
                 "temperature": AnalystConfig.TEMPERATURE
             }
         )
 
-    async def analyze(self, request: str) -> str:
-        """Analyze the market data."""
-        user_proxy_agent = UserProxyAgent(
+        # Built once and reused for every chat with this agent
+        self.user_proxy = UserProxyAgent(
             name="User",
             human_input_mode="NEVER",
-            code_execution_config={"executor": code_executor},
-            is_termination_msg=lambda msg: True,  # Automatically proceed without waiting for input
+            code_execution_config={"executor": get_code_executor()},
+            is_termination_msg=_always_terminate,
         )
-        
-        # Call initiate_chat and get the result directly
-        chat_result = user_proxy_agent.initiate_chat(self.agent, message=request)
+
+    async def analyze(self, request: str) -> str:
+        """Analyze the market data."""
+        # Use the async chat so the event loop is free to run other agents meanwhile
+        chat_result = await self.user_proxy.a_initiate_chat(self.agent, message=request)
         
         # Return the summary from the chat result
         return chat_result.summary  # Use 'summary' instead of 'content'
\ No newline at end of file
@@ -0,0 +1,12 @@
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def get_code_executor():
+    """Return the code executor shared by all agents, created on first use."""
+    from autogen.coding import LocalCommandLineCodeExecutor
+
+    workdir = Path("coding")
+    workdir.mkdir(exist_ok=True)
+    return LocalCommandLineCodeExecutor(work_dir=workdir)
@@ -0,0 +1,28 @@
+import atexit
+import threading
+
+import httpx
+
+# Timeout for LLM requests; local models can take a while to answer
+REQUEST_TIMEOUT = httpx.Timeout(120.0, connect=5.0)
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+_client = None
+_lock = threading.Lock()
+
+
+class PooledHttpClient(httpx.Client):
+    # autogen deep copies llm_config, return the same instance so the pool stays shared
+    def __deepcopy__(self, memo):
+        return self
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide keep-alive HTTP client used for the LLM endpoint."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = PooledHttpClient(limits=POOL_LIMITS, timeout=REQUEST_TIMEOUT)
+                atexit.register(_client.close)
+    return _client
@@ -1,35 +1,96 @@
 import asyncio
+from typing import Callable
 
-from services.asset_data import AssetDataProcessor
-from services.asset_fundamentals import FundamentalsFetcher
+from services._yf_cache import download_batch, warm_up
+from services.asset import Asset
 
 from agents.analyst import AnalystAgent
 from agents.manager import ManagerAgent
 
-async def analyze_stock(asset: str, start_date: str, end_date: str) -> None:
-    """Main function to analyze a stock."""
+# Load yfinance while the agents are being set up
+warm_up()
+
+def create_agents() -> tuple:
+    """Create the (technical analyst, fundamental analyst, manager) used by one analysis at a time."""
+    return (
+        AnalystAgent(name="Technical Analyst", focus="technical data"),
+        AnalystAgent(name="Fundamental Analyst", focus="fundamental data"),
+        ManagerAgent(name="Market Manager")
+    )
+
+# Idle agent sets, shared across analyses. A set is created up front and more are only
+# added when several analyses run at the same time.
+_agent_pool = [create_agents()]
+
+def _acquire_agents() -> tuple:
+    """Take an idle agent set from the pool, creating one if every set is in use."""
+    return _agent_pool.pop() if _agent_pool else create_agents()
+
+def _release_agents(agents: tuple) -> None:
+    """Return an agent set to the pool once its analysis is done."""
+    _agent_pool.append(agents)
+
+async def analyze_stock(
+    asset: str,
+    start_date: str,
+    end_date: str,
+    agents: tuple = None,
+    on_summary: Callable[[str, str], None] = None
+) -> str:
+    """
+    Main function to analyze a stock. Returns the manager's decision.
+
+    on_summary, if given, is called with (analyst name, summary) as soon as each analyst
+    finishes, so partial results are available before the slower analyst and the manager are done.
+    Without agents, an idle set is taken from the shared pool for the duration of the analysis.
+    """
+    if agents is None:
+        pooled = _acquire_agents()
+        try:
+            return await analyze_stock(asset, start_date, end_date, pooled, on_summary)
+        finally:
+            _release_agents(pooled)
+
+    technical_analyst, fundamental_analyst, manager = agents
+
+    async def run_analyst(analyst: AnalystAgent, request: str) -> str:
+        summary = await analyst.analyze(request)
+        if on_summary is not None:
+            # A failing callback must not discard a valid summary
+            try:
+                on_summary(analyst.agent.name, summary)
+            except Exception as e:
+                print(f"Error in on_summary callback for {analyst.agent.name}: {str(e)}")
+        return summary
+
     try:
-        # Fetch and prepare data
-        df_with_indicators = AssetDataProcessor.fetch_and_prepare_data(asset, "1d", start_date, end_date)
+        # Construction makes no request, Ticker.info is first fetched by get_fundamentals
+        stock = Asset(asset, start_date=start_date, end_date=end_date)
+
+        # Fetch market data and fundamentals concurrently, both are blocking yfinance calls
+        market_data, fundamentals = await asyncio.gather(
+            asyncio.to_thread(stock.get_market_data, "1d", start_date, end_date),
+            asyncio.to_thread(stock.get_fundamentals)
+        )
 
-        # Fetch fundamentals
-        fundamentals = FundamentalsFetcher.fetch_fundamentals(asset)
+        # Only the latest indicator values are needed
+        indicators = stock.latest_indicators(market_data)
 
         # Prepare analysis requests
         technical_request = f"""
         Please analyze the following technical data for {asset}:
         
         Technical Indicators:
-        - RSI: {df_with_indicators['rsi'].iloc[-1]:.2f}
-        - EMA20: ${df_with_indicators['ema_20'].iloc[-1]:.2f}
-        - EMA50: ${df_with_indicators['ema_50'].iloc[-1]:.2f}
-        - Volatility (ATR): {df_with_indicators['volatility'].iloc[-1]:.2f}
+        - RSI: {indicators['rsi']:.2f}
+        - EMA20: ${indicators['ema_20']:.2f}
+        - EMA50: ${indicators['ema_50']:.2f}
+        - Volatility (ATR): {indicators['volatility']:.2f}
         
         Provide a summary of the technical analysis.
         """
 
         # Fundamental request
-        fundamentals_summary = "\n".join([f"{key}: {value}" for key, value in fundamentals.items()])
+        fundamentals_summary = "\n".join(f"{key}: {value}" for key, value in fundamentals.items())
         fundamental_request = f"""
         Please analyze the following fundamental data for {asset}:
         
@@ -39,27 +100,87 @@ async def analyze_stock(asset: str, start_date: str, end_date: str) -> None:
         Provide a summary of the fundamental analysis.
         """
 
-        # Create analyst agents
-        technical_analyst = AnalystAgent(name="Technical Analyst", focus="technical data")
-        fundamental_analyst = AnalystAgent(name="Fundamental Analyst", focus="fundamental data")
+        # Analyze data (the two analysts are independent, so run them concurrently)
+        results = await asyncio.gather(
+            run_analyst(technical_analyst, technical_request),
+            run_analyst(fundamental_analyst, fundamental_request),
+            return_exceptions=True
+        )
+
+        analyst_summaries = []
+        for analyst, result in zip((technical_analyst, fundamental_analyst), results):
+            if isinstance(result, Exception):
+                print(f"Error during {analyst.agent.name} analysis: {str(result)}")
+            else:
+                analyst_summaries.append(result)
 
-        # Analyze data
-        technical_summary =  await technical_analyst.analyze(technical_request)
-        fundamental_summary =  await fundamental_analyst.analyze(fundamental_request)
+        if not analyst_summaries:
+            raise RuntimeError(f"All analysts failed for {asset}.")
 
-        # Create a manager to make a decision based on the analysts' outputs
-        manager = ManagerAgent(name="Market Manager")
-        await manager.make_decision([technical_summary, fundamental_summary])
+        # Have the manager make a decision based on the analysts' outputs
+        return await manager.make_decision(analyst_summaries)
 
     except Exception as e:
         print(f"Error during analysis: {str(e)}")
 
+async def analyze_portfolio(assets: list, start_date: str, end_date: str, max_concurrency: int = 8) -> list:
+    """
+    Analyze several stocks concurrently, fetching their market data in a single request.
+
+    Args:
+        assets (list): Asset ticker symbols
+        start_date (str): Start date in 'YYYY-MM-DD' format
+        end_date (str): End date in 'YYYY-MM-DD' format
+        max_concurrency (int): Maximum number of analyses running at once, keeps the local LLM server from being overloaded
+
+    Returns:
+        list: The manager's decision for each asset, in order. None where the analysis failed,
+            or the raised exception where no agents could be set up for it
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+
+    if len(assets) > 1:
+        # Warms the download cache so each analysis reads its market data from memory.
+        # On failure each analysis falls back to its own download.
+        try:
+            await asyncio.to_thread(download_batch, assets, "1d", start_date, end_date)
+        except Exception as e:
+            print(f"Error during batched market data download: {str(e)}")
+
+    # Each running analysis holds its own agent set from the shared pool, which only grows
+    # when more analyses run at once than it has idle sets
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def analyze_one(asset: str) -> str:
+        async with semaphore:
+            return await analyze_stock(asset, start_date, end_date)
+
+    return await asyncio.gather(*(analyze_one(asset) for asset in assets), return_exceptions=True)
+
+def print_summary(analyst_name: str, summary: str) -> None:
+    """Print an analyst's summary as soon as it is ready."""
+    print(f"\n{analyst_name} summary:\n{summary}\n")
+
 async def main():
     await analyze_stock(
         asset="NVDA",
         start_date="2024-07-01",
-        end_date="2024-12-27"
+        end_date="2024-12-27",
+        on_summary=print_summary
     )
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop  # Faster event loop for the concurrent LLM and market data calls
+    except ImportError:
+        uvloop = None
+
+    # uvloop.run replaces the deprecated uvloop.install, it was added in uvloop 0.18
+    if uvloop is not None and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,152 @@
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List
+
+import pandas as pd
+
+if TYPE_CHECKING:  # yfinance is imported lazily, see _yf
+    import yfinance
+
+MAX_ENTRIES = 256
+INFO_TTL = 900          # seconds, fundamentals change slowly
+RECENT_TTL = 300        # seconds, ranges reaching today still get new bars
+HISTORICAL_TTL = 86400  # seconds, closed historical ranges do not change
+
+_info_cache = {}
+_download_cache = {}
+_lock = threading.Lock()
+
+yf = None
+
+
+def _yf():
+    """Import yfinance on first use, it is slow to import."""
+    global yf
+    if yf is None:
+        import yfinance
+        yf = yfinance
+    return yf
+
+
+def warm_up() -> None:
+    """Import yfinance and set up a Ticker in a background thread, ahead of the first request."""
+    threading.Thread(target=lambda: _yf().Ticker("AAPL"), name="yfinance-warmup", daemon=True).start()
+
+
+def _download_ttl(end: str) -> float:
+    """Return how long a download ending at end (YYYY-MM-DD, None for now) stays valid."""
+    if end is None or end >= datetime.now().strftime('%Y-%m-%d'):
+        return RECENT_TTL
+    return HISTORICAL_TTL
+
+
+def _lookup(cache: dict, key):
+    """Return the cached value for key, or None if it is missing or expired."""
+    with _lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() > expires_at:
+            del cache[key]
+            return None
+        return value
+
+
+def _store(cache: dict, key, value, ttl: float) -> None:
+    """Store a value valid for ttl seconds, evicting the oldest entry once the cache is full."""
+    with _lock:
+        if key not in cache and len(cache) >= MAX_ENTRIES:
+            del cache[next(iter(cache))]
+        cache[key] = (time.monotonic() + ttl, value)
+
+
+@lru_cache(maxsize=MAX_ENTRIES)
+def get_ticker(symbol: str) -> "yfinance.Ticker":
+    """Return a shared yfinance Ticker for the symbol."""
+    return _yf().Ticker(symbol)
+
+
+def get_info(symbol: str) -> dict:
+    """Return Ticker.info for the symbol, cached for INFO_TTL seconds."""
+    info = _lookup(_info_cache, symbol)
+    if info is None:
+        # A fresh Ticker, the shared one keeps its first .info forever
+        info = _yf().Ticker(symbol).info
+        _store(_info_cache, symbol, info, INFO_TTL)
+    return info
+
+
+def download(symbol: str, interval: str, start: str, end: str) -> pd.DataFrame:
+    """
+    Return yf.download results for the symbol and range, cached for the range's TTL.
+
+    Columns are the single-level price fields ('Open', 'High', ...), the same shape
+    download_batch caches, so the result does not depend on which of them filled the cache.
+    """
+    key = (symbol, interval, start, end)
+    data = _lookup(_download_cache, key)
+    if data is None:
+        data = _yf().download(
+            tickers=symbol,
+            interval=interval,
+            start=start,
+            end=end,
+            progress=False
+        )
+        # Recent yfinance versions return (Price, Ticker) columns even for a single ticker
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
+        if not data.empty:
+            _store(_download_cache, key, data, _download_ttl(end))
+    # Callers modify the frame they get back, keep the cached one untouched
+    return data.copy()
+
+
+def download_batch(symbols: List[str], interval: str, start: str, end: str) -> Dict[str, pd.DataFrame]:
+    """
+    Return yf.download results for several symbols, keyed by symbol, with the same
+    single-level columns as download().
+
+    Symbols not already cached are fetched together in a single yf.download request and
+    cached individually, so later download() calls for them are served from the cache.
+    Symbols without data are left out of the result.
+    """
+    frames = {}
+    missing = []
+    for symbol in symbols:
+        data = _lookup(_download_cache, (symbol, interval, start, end))
+        if data is None:
+            missing.append(symbol)
+        else:
+            frames[symbol] = data.copy()
+
+    if not missing:
+        return frames
+
+    data = _yf().download(
+        tickers=" ".join(missing),
+        interval=interval,
+        start=start,
+        end=end,
+        group_by='ticker',
+        threads=True,
+        progress=False
+    )
+    ttl = _download_ttl(end)
+    for symbol in missing:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            frame = data[symbol]
+        else:
+            frame = data
+        # Rows are aligned across all symbols, drop dates this symbol did not trade
+        frame = frame.dropna(how='all')
+        if frame.empty:
+            continue
+        _store(_download_cache, (symbol, interval, start, end), frame, ttl)
+        frames[symbol] = frame.copy()
+    return frames
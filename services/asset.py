@@ -1,8 +1,29 @@
+import numpy as np
 import pandas as pd
-import yfinance as yf
-import ta
 from datetime import datetime, timedelta
 
+try:
+    import talib
+except ImportError:  # TA-Lib is optional, fall back to the pure Python ta package
+    talib = None
+
+from services._yf_cache import download, get_info, get_ticker
+from services.indicators_numba import NUMBA_AVAILABLE, compute_indicators, latest_indicators
+
+# Indicator columns added by Asset.add_technical_indicators
+INDICATORS = ('rsi', 'ema_20', 'ema_50', 'volatility')
+
+PRICE_DTYPES = {'Open': np.float32, 'High': np.float32, 'Low': np.float32, 'Close': np.float32}
+
+
+def _price_arrays(data: pd.DataFrame, dtype) -> tuple:
+    """Return contiguous (close, high, low) arrays of the given dtype."""
+    return tuple(
+        np.ascontiguousarray(data[column].to_numpy(dtype=dtype))
+        for column in ('Close', 'High', 'Low')
+    )
+
+
 class Asset:
     def __init__(self, asset: str, start_date: str = None, end_date: str = None):
         """
@@ -15,12 +36,17 @@ class Asset:
         """
         print(f"\nInitializing analyzer for {asset}...")
         self.asset = asset
-        self.ticker = yf.Ticker(asset)
-        self.sector = self.ticker.info.get('sector', 'N/A')
+        self.ticker = get_ticker(asset)
         
         # Set default date range if not provided
-        self.end_date = end_date or datetime.now().strftime('%Y-%m-%d')
-        self.start_date = start_date or (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+        now = datetime.now()
+        self.end_date = end_date or now.strftime('%Y-%m-%d')
+        self.start_date = start_date or (now - timedelta(days=365)).strftime('%Y-%m-%d')
+
+    @property
+    def sector(self) -> str:
+        """Sector of the asset, fetched with Ticker.info on first use so construction makes no request."""
+        return get_info(self.asset).get('sector', 'N/A')
 
     # ==========================
     # Fundamentals Section
@@ -29,15 +55,16 @@ class Asset:
     def get_fundamentals(self) -> dict:
         """Fetch fundamental data for the asset."""
         print(f"Fetching fundamentals...")
+        info = get_info(self.asset)
         fundamentals = {
-            'Trailing P/E Ratio': self.ticker.info.get('trailingPE', 'N/A'),
-            'Forward P/E Ratio': self.ticker.info.get('forwardPE', 'N/A'),
-            'Market Cap': self.ticker.info.get('marketCap', 'N/A'),
-            'Revenue': self.ticker.info.get('totalRevenue', 'N/A'),
-            'Gross Profit': self.ticker.info.get('grossProfits', 'N/A'),
-            'Net Income': self.ticker.info.get('netIncomeToCommon', 'N/A'),
-            'EPS': self.ticker.info.get('trailingEps', 'N/A'),
-            'Dividend Yield': self.ticker.info.get('dividendYield', 'N/A'),
+            'Trailing P/E Ratio': info.get('trailingPE', 'N/A'),
+            'Forward P/E Ratio': info.get('forwardPE', 'N/A'),
+            'Market Cap': info.get('marketCap', 'N/A'),
+            'Revenue': info.get('totalRevenue', 'N/A'),
+            'Gross Profit': info.get('grossProfits', 'N/A'),
+            'Net Income': info.get('netIncomeToCommon', 'N/A'),
+            'EPS': info.get('trailingEps', 'N/A'),
+            'Dividend Yield': info.get('dividendYield', 'N/A'),
         }
         print("Successfully fetched fundamentals.")
         return fundamentals
@@ -89,36 +116,88 @@ class Asset:
         start = start_date or self.start_date
         end = end_date or self.end_date
         
-        data = yf.download(
-            tickers=self.asset, 
-            interval=interval, 
-            start=start, 
-            end=end, 
-            progress=False
-        )
+        data = download(self.asset, interval, start, end)
         if data.empty:
             raise ValueError(f"No data available for {self.asset}.")
         
-        data = data.reset_index()
-        data.columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+        return self.prepare_market_data(data)
+
+    @staticmethod
+    def prepare_market_data(data: pd.DataFrame) -> pd.DataFrame:
+        """Turn a raw yfinance download into a Date/Open/High/Low/Close/Volume frame."""
+        # Recent yfinance versions return (Price, Ticker) columns even for a single ticker
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
+
+        # Select columns by name, their order differs between yfinance versions
+        data = data[['Open', 'High', 'Low', 'Close', 'Volume']].reset_index()
+        data = data.rename(columns={data.columns[0]: 'Date'}).rename_axis(columns=None)
+
+        # float32 is plenty for prices and halves the memory the indicator passes stream through
+        data = data.astype(PRICE_DTYPES)
         return data
 
-    def add_technical_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Add technical indicators to market data."""
+    @staticmethod
+    def _compute_indicators(data: pd.DataFrame, indicators: tuple = INDICATORS) -> dict:
+        """Return the requested indicators as NumPy arrays aligned with the data, keyed by column name."""
+        if not indicators:
+            return {}
+
+        if NUMBA_AVAILABLE:
+            # A single pass computes all four, keep the requested ones
+            values = dict(zip(INDICATORS, compute_indicators(*_price_arrays(data, np.float32))))
+            return {name: values[name] for name in indicators}
+
+        if talib is not None:
+            # TA-Lib only accepts float64 input
+            close, high, low = _price_arrays(data, np.float64)
+            calculations = {
+                'rsi': lambda: talib.RSI(close, timeperiod=14),
+                'ema_20': lambda: talib.EMA(close, timeperiod=20),
+                'ema_50': lambda: talib.EMA(close, timeperiod=50),
+                'volatility': lambda: talib.ATR(high, low, close, timeperiod=14),
+            }
+        else:
+            import ta  # Only needed when TA-Lib is missing
+            calculations = {
+                'rsi': lambda: ta.momentum.RSIIndicator(data['Close']).rsi().to_numpy(),
+                'ema_20': lambda: ta.trend.EMAIndicator(data['Close'], window=20).ema_indicator().to_numpy(),
+                'ema_50': lambda: ta.trend.EMAIndicator(data['Close'], window=50).ema_indicator().to_numpy(),
+                'volatility': lambda: ta.volatility.AverageTrueRange(
+                    data['High'], data['Low'], data['Close']
+                ).average_true_range().to_numpy(),
+            }
+        return {name: calculations[name]() for name in indicators}
+
+    @staticmethod
+    def add_technical_indicators(data: pd.DataFrame, indicators: tuple = INDICATORS) -> pd.DataFrame:
+        """
+        Add technical indicators to market data.
+
+        Args:
+            data (pd.DataFrame): Market data from get_market_data
+            indicators (tuple, optional): Indicator columns to add. Defaults to all of INDICATORS.
+        """
         print("Calculating technical indicators...")
-        data['rsi'] = ta.momentum.RSIIndicator(data['Close']).rsi()
-        data['ema_20'] = ta.trend.EMAIndicator(data['Close'], window=20).ema_indicator()
-        data['ema_50'] = ta.trend.EMAIndicator(data['Close'], window=50).ema_indicator()
-        data['volatility'] = ta.volatility.AverageTrueRange(
-            data['High'], data['Low'], data['Close']
-        ).average_true_range()
+        for name, values in Asset._compute_indicators(data, indicators).items():
+            data[name] = values
         return data
 
+    @staticmethod
+    def latest_indicators(data: pd.DataFrame) -> dict:
+        """Return the latest value of each technical indicator without adding columns to the data."""
+        print("Calculating technical indicators...")
+        if NUMBA_AVAILABLE:
+            # The kernel keeps only its final running values, no series are allocated
+            return dict(zip(INDICATORS, latest_indicators(*_price_arrays(data, np.float32))))
+        return {name: values[-1] for name, values in Asset._compute_indicators(data).items()}
+
     def get_market_data_with_indicators(
         self, 
         interval: str = '1d',
         start_date: str = None,
-        end_date: str = None
+        end_date: str = None,
+        indicators: tuple = INDICATORS
     ) -> pd.DataFrame:
         """
         Fetch market data and calculate indicators in one call.
@@ -127,13 +206,14 @@ class Asset:
             interval (str): Data interval (e.g., '1d', '1h')
             start_date (str, optional): Override default start date
             end_date (str, optional): Override default end date
+            indicators (tuple, optional): Indicator columns to add. Defaults to all of INDICATORS.
         """
         data = self.get_market_data(interval, start_date, end_date)
-        return self.add_technical_indicators(data)
+        return self.add_technical_indicators(data, indicators)
 
 
 if __name__ == "__main__":
-    # Example usage
+    # Example usage, run from the repository root: python -m services.asset
     
     # Create asset analyzer with default 1-year range
     # Or specify custom date range
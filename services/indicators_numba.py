@@ -0,0 +1,152 @@
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional, the kernel still runs as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Indicator windows, matching the TA-Lib defaults used by Asset
+RSI_WINDOW = 14
+ATR_WINDOW = 14
+EMA_FAST = 20
+EMA_SLOW = 50
+
+
+@njit(cache=True)
+def _indicator_pass(close, high, low, rsi, ema_20, ema_50, atr):
+    """
+    Run the single pass over the price arrays, writing into the output arrays.
+
+    Outputs as long as the inputs receive every value. Length-1 outputs are overwritten
+    at each step and end up holding only the latest value.
+    """
+    n = close.shape[0]
+    last = rsi.shape[0] - 1
+
+    alpha_fast = 2.0 / (EMA_FAST + 1)
+    alpha_slow = 2.0 / (EMA_SLOW + 1)
+    fast = 0.0
+    slow = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    avg_tr = 0.0
+
+    for i in range(n):
+        j = min(i, last)
+        price = close[i]
+
+        # EMAs
+        if i < EMA_FAST:
+            fast += price
+            if i == EMA_FAST - 1:
+                fast /= EMA_FAST
+                ema_20[j] = fast
+        else:
+            fast = alpha_fast * price + (1.0 - alpha_fast) * fast
+            ema_20[j] = fast
+
+        if i < EMA_SLOW:
+            slow += price
+            if i == EMA_SLOW - 1:
+                slow /= EMA_SLOW
+                ema_50[j] = slow
+        else:
+            slow = alpha_slow * price + (1.0 - alpha_slow) * slow
+            ema_50[j] = slow
+
+        if i == 0:
+            continue
+
+        # RSI (Wilder)
+        change = price - close[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if i < RSI_WINDOW:
+            avg_gain += gain
+            avg_loss += loss
+        else:
+            if i == RSI_WINDOW:
+                avg_gain = (avg_gain + gain) / RSI_WINDOW
+                avg_loss = (avg_loss + loss) / RSI_WINDOW
+            else:
+                avg_gain = (avg_gain * (RSI_WINDOW - 1) + gain) / RSI_WINDOW
+                avg_loss = (avg_loss * (RSI_WINDOW - 1) + loss) / RSI_WINDOW
+            total = avg_gain + avg_loss
+            rsi[j] = 100.0 * avg_gain / total if total > 0.0 else 0.0
+
+        # ATR (Wilder)
+        true_range = max(
+            high[i] - low[i],
+            abs(high[i] - close[i - 1]),
+            abs(low[i] - close[i - 1])
+        )
+        if i < ATR_WINDOW:
+            avg_tr += true_range
+        else:
+            if i == ATR_WINDOW:
+                avg_tr = (avg_tr + true_range) / ATR_WINDOW
+            else:
+                avg_tr = (avg_tr * (ATR_WINDOW - 1) + true_range) / ATR_WINDOW
+            atr[j] = avg_tr
+
+
+@njit(cache=True)
+def compute_indicators(close, high, low):
+    """
+    Compute RSI, EMA20, EMA50 and ATR in a single pass over the price arrays.
+
+    Uses the same seeding as TA-Lib: EMAs start from the simple average of their
+    first window, RSI and ATR use Wilder smoothing seeded with a simple average.
+    Values before each indicator's warm-up period are NaN. Running state is kept
+    in float64 whatever the input dtype.
+
+    Args:
+        close (np.ndarray): Contiguous float32 or float64 array of close prices
+        high (np.ndarray): Contiguous float32 or float64 array of high prices
+        low (np.ndarray): Contiguous float32 or float64 array of low prices
+
+    Returns:
+        tuple: (rsi, ema_20, ema_50, atr) arrays with the same length as the inputs
+    """
+    n = close.shape[0]
+    rsi = np.full(n, np.nan)
+    ema_20 = np.full(n, np.nan)
+    ema_50 = np.full(n, np.nan)
+    atr = np.full(n, np.nan)
+    _indicator_pass(close, high, low, rsi, ema_20, ema_50, atr)
+    return rsi, ema_20, ema_50, atr
+
+
+@njit(cache=True)
+def latest_indicators(close, high, low):
+    """
+    Compute only the final RSI, EMA20, EMA50 and ATR values, without allocating the series.
+
+    Runs the same pass as compute_indicators and keeps just its running state.
+
+    Returns:
+        tuple: (rsi, ema_20, ema_50, atr) floats, NaN where the data is shorter than the warm-up period
+    """
+    rsi = np.full(1, np.nan)
+    ema_20 = np.full(1, np.nan)
+    ema_50 = np.full(1, np.nan)
+    atr = np.full(1, np.nan)
+    _indicator_pass(close, high, low, rsi, ema_20, ema_50, atr)
+    return rsi[0], ema_20[0], ema_50[0], atr[0]
+
+
+def _warm_up() -> None:
+    warmup = np.zeros(64, dtype=np.float32)
+    compute_indicators(warmup, warmup, warmup)
+    latest_indicators(warmup, warmup, warmup)
+
+
+# Compile the kernels in the background so neither the import nor the first analysis waits for it
+if NUMBA_AVAILABLE:
+    threading.Thread(target=_warm_up, name="indicators-warmup", daemon=True).start()
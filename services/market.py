@@ -1,8 +1,44 @@
+import logging
 from typing import Dict, List
 from datetime import datetime, timedelta
-from asset import Asset
+from services._yf_cache import download_batch
+from services.asset import INDICATORS, Asset
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
+# Columns of the rows collected by get_rates_analysis
+RATES_COLUMNS = ['symbol', 'current_rate', 'weekly_change', 'monthly_change', 'trend', 'rsi', 'volatility']
+
+
+def _bulk_fetch(
+    symbols: List[str],
+    interval: str,
+    start_date: str,
+    end_date: str,
+    indicators: tuple = INDICATORS
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch market data for all symbols in a single yfinance request and add the requested
+    technical indicators. Symbols without data are left out of the result.
+    """
+    frames = download_batch(symbols, interval, start_date, end_date)
+    return {
+        symbol: Asset.add_technical_indicators(Asset.prepare_market_data(data), indicators)
+        for symbol, data in frames.items()
+    }
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """Store the float metrics as float32 and volume as int64 when it has no gaps."""
+    float_cols = df.select_dtypes('float64').columns.drop('volume', errors='ignore')
+    df[float_cols] = df[float_cols].astype('float32')
+    if 'volume' in df and df['volume'].notna().all():
+        df['volume'] = df['volume'].astype('int64')
+    return df
+
+
 class Market:
     def __init__(self, start_date: str = None, end_date: str = None):
         """
@@ -12,11 +48,15 @@ class Market:
             start_date (str, optional): Start date in 'YYYY-MM-DD' format. Defaults to 1 year ago.
             end_date (str, optional): End date in 'YYYY-MM-DD' format. Defaults to today.
         """
-        print("\nInitializing Market analyzer...")
+        logger.info("Initializing Market analyzer...")
         
         # Set default date range if not provided
-        self.end_date = end_date or datetime.now().strftime('%Y-%m-%d')
-        self.start_date = start_date or (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%d')
+        now = datetime.now()
+        self.end_date = end_date or now.strftime('%Y-%m-%d')
+        self.start_date = start_date or (now - timedelta(days=365)).strftime('%Y-%m-%d')
+        
+        # Symbol name -> error message for the symbols that failed in the last analysis
+        self.last_failures: Dict[str, str] = {}
         
         # Major indices and ETFs to track
         self.market_indicators = {
@@ -39,6 +79,13 @@ class Market:
                 '30-Year Treasury': '^TYX'
             }
         }
+        
+        # Symbol sets used by the analyses, these never change after construction
+        self._trend_symbols = {
+            **self.market_indicators['indices'],
+            **self.market_indicators['etfs']
+        }
+        self._yield_symbols = {'13W': '^IRX', '5Y': '^FVX', '10Y': '^TNX', '30Y': '^TYX'}
 
     def get_market_trends(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         """
@@ -53,59 +100,73 @@ class Market:
         start = start_date or self.start_date
         end = end_date or self.end_date
         
-        # Create list to store data for DataFrame
-        market_data = []
+        all_symbols = self._trend_symbols
+        self.last_failures = {}
         
-        # Combine all symbols to analyze
-        all_symbols = {
-            **self.market_indicators['indices'],
-            **self.market_indicators['etfs']
-        }
+        # One array per column, filled per symbol
+        n = len(all_symbols)
+        names = np.array(list(all_symbols.keys()), dtype=object)
+        symbols = np.array(list(all_symbols.values()), dtype=object)
+        current_price = np.full(n, np.nan)
+        start_price = np.full(n, np.nan)
+        rsi = np.full(n, np.nan)
+        ema_20 = np.full(n, np.nan)
+        ema_50 = np.full(n, np.nan)
+        volatility = np.full(n, np.nan)
+        volume = np.full(n, np.nan)
+        analyzed = np.zeros(n, dtype=bool)
         
-        for name, symbol in all_symbols.items():
+        frames = _bulk_fetch(
+            list(all_symbols.values()), '1d', start, end,
+            indicators=('rsi', 'ema_20', 'ema_50', 'volatility')
+        )
+        
+        for i, (name, symbol) in enumerate(all_symbols.items()):
             try:
-                asset = Asset(symbol)
-                data = asset.get_market_data_with_indicators(
-                    interval='1d',
-                    start_date=start,
-                    end_date=end
-                )
+                if symbol not in frames:
+                    raise ValueError(f"No data available for {symbol}.")
+                data = frames[symbol]
                 
                 if not data.empty:
-                    current_price = data['Close'].iloc[-1]
-                    start_price = data['Close'].iloc[0]
-                    
-                    market_data.append({
-                        'name': name,
-                        'symbol': symbol,
-                        'current_price': current_price,
-                        'period_return': ((current_price - start_price) / start_price) * 100,
-                        'rsi': data['rsi'].iloc[-1],
-                        'ema_20': data['ema_20'].iloc[-1],
-                        'ema_50': data['ema_50'].iloc[-1],
-                        'volatility': data['volatility'].iloc[-1],
-                        'volume': data['Volume'].iloc[-1],
-                        'above_20_ema': current_price > data['ema_20'].iloc[-1],
-                        'above_50_ema': current_price > data['ema_50'].iloc[-1],
-                        'trend': self._determine_trend(
-                            current_price, 
-                            data['ema_20'].iloc[-1], 
-                            data['ema_50'].iloc[-1]
-                        )
-                    })
+                    # Read the whole last row at once instead of indexing each column
+                    current_price[i], rsi[i], ema_20[i], ema_50[i], volatility[i] = (
+                        data.tail(1)[['Close', 'rsi', 'ema_20', 'ema_50', 'volatility']].to_numpy()[0]
+                    )
+                    start_price[i] = data['Close'].iat[0]
+                    volume[i] = data['Volume'].iat[-1]
+                    analyzed[i] = True
             except Exception as e:
-                print(f"Error analyzing {name}: {str(e)}")
+                logger.warning("Error analyzing %s: %s", name, e)
+                self.last_failures[name] = str(e)
         
-        # Convert list of dictionaries to DataFrame
-        df = pd.DataFrame(market_data)
+        # Keep the symbols that were analyzed
+        names, symbols, current_price, start_price, rsi, ema_20, ema_50, volatility, volume = (
+            column[analyzed]
+            for column in (names, symbols, current_price, start_price, rsi, ema_20, ema_50, volatility, volume)
+        )
         
-        # Set name as index
-        df.set_index('name', inplace=True)
+        # Derived columns are computed for all symbols at once
+        df = pd.DataFrame(
+            {
+                'symbol': symbols,
+                'current_price': current_price,
+                'period_return': (current_price - start_price) / start_price * 100,
+                'rsi': rsi,
+                'ema_20': ema_20,
+                'ema_50': ema_50,
+                'volatility': volatility,
+                'volume': volume,
+                'above_20_ema': current_price > ema_20,
+                'above_50_ema': current_price > ema_50,
+                'trend': self._trend_vec(current_price, ema_20, ema_50)
+            },
+            index=pd.Index(names, name='name')
+        )
         
         # Sort by period return
-        df = df.sort_values('period_return', ascending=False)
+        df.sort_values('period_return', ascending=False, kind='stable', inplace=True)
         
-        return df
+        return _downcast(df)
 
     def get_rates_analysis(self, start_date: str = None, end_date: str = None) -> pd.DataFrame:
         """
@@ -120,57 +181,63 @@ class Market:
         start = start_date or self.start_date
         end = end_date or self.end_date
         
-        # Create list to store data for DataFrame
+        # Create lists to store rows and their names for DataFrame
         rates_data = []
+        names = []
+        self.last_failures = {}
         
-        for name, symbol in self.market_indicators['bonds'].items():
+        bonds = self.market_indicators['bonds']
+        frames = _bulk_fetch(list(bonds.values()), '1d', start, end, indicators=('rsi', 'volatility'))
+        
+        for name, symbol in bonds.items():
             try:
-                asset = Asset(symbol)
-                data = asset.get_market_data_with_indicators(
-                    interval='1d',
-                    start_date=start,
-                    end_date=end
-                )
+                if symbol not in frames:
+                    raise ValueError(f"No data available for {symbol}.")
+                data = frames[symbol]
                 
                 if not data.empty:
-                    current_rate = data['Close'].iloc[-1]
-                    week_ago_rate = data['Close'].iloc[-5] if len(data) >= 5 else data['Close'].iloc[0]
-                    month_ago_rate = data['Close'].iloc[0]
+                    current_rate, rsi, volatility = (
+                        data.tail(1)[['Close', 'rsi', 'volatility']].to_numpy()[0]
+                    )
+                    closes = data['Close'].to_numpy()
+                    week_ago_rate = closes[-5] if len(closes) >= 5 else closes[0]
+                    month_ago_rate = closes[0]
                     
-                    rates_data.append({
-                        'name': name,
-                        'symbol': symbol,
-                        'current_rate': current_rate,
-                        'weekly_change': current_rate - week_ago_rate,
-                        'monthly_change': current_rate - month_ago_rate,
-                        'trend': 'Rising' if current_rate > week_ago_rate else 'Falling',
-                        'rsi': data['rsi'].iloc[-1],
-                        'volatility': data['volatility'].iloc[-1]
-                    })
+                    # Values in RATES_COLUMNS order
+                    rates_data.append([
+                        symbol,
+                        current_rate,
+                        current_rate - week_ago_rate,
+                        current_rate - month_ago_rate,
+                        'Rising' if current_rate > week_ago_rate else 'Falling',
+                        rsi,
+                        volatility
+                    ])
+                    names.append(name)
             except Exception as e:
-                print(f"Error analyzing {name}: {str(e)}")
-        
-        # Convert list of dictionaries to DataFrame
-        df = pd.DataFrame(rates_data)
+                logger.warning("Error analyzing %s: %s", name, e)
+                self.last_failures[name] = str(e)
         
-        # Set name as index
-        df.set_index('name', inplace=True)
+        # Convert rows to DataFrame, indexed by name
+        df = pd.DataFrame(rates_data, columns=RATES_COLUMNS, index=pd.Index(names, name='name'))
         
         # Sort by current rate
-        df = df.sort_values('current_rate', ascending=False)
+        df.sort_values('current_rate', ascending=False, kind='stable', inplace=True)
         
-        return df
+        return _downcast(df)
 
-    def _determine_trend(self, price: float, ema20: float, ema50: float) -> str:
-        """Determine trend based on price and EMAs."""
-        if price > ema20 > ema50:
-            return "Strong Uptrend"
-        elif price > ema20:
-            return "Uptrend"
-        elif price < ema20 < ema50:
-            return "Strong Downtrend"
-        else:
-            return "Downtrend"
+    @staticmethod
+    def _trend_vec(price: np.ndarray, ema20: np.ndarray, ema50: np.ndarray) -> np.ndarray:
+        """Determine the trend of each row based on price and EMAs."""
+        return np.select(
+            [
+                (price > ema20) & (ema20 > ema50),
+                price > ema20,
+                (price < ema20) & (ema20 < ema50)
+            ],
+            ["Strong Uptrend", "Uptrend", "Strong Downtrend"],
+            default="Downtrend"
+        )
 
     def get_yield_curve(self) -> Dict:
         """
@@ -179,33 +246,22 @@ class Market:
         """
         yields = {}
         try:
-            # Get current yields using Asset class
+            # Get current yields for all four tenors in a single request, only Close is needed.
+            # Look back a week so weekends and holidays still have a latest close.
+            start = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            tenors = self._yield_symbols
+            frames = download_batch(list(tenors.values()), '1d', start, None)
+            for symbol in tenors.values():
+                if symbol not in frames:
+                    raise ValueError(f"No data available for {symbol}.")
             yields = {
-                '13W': Asset('^IRX').get_market_data_with_indicators(
-                    interval='1d',
-                    start_date=datetime.now().strftime('%Y-%m-%d'),
-                    end_date=datetime.now().strftime('%Y-%m-%d')
-                )['Close'].iloc[-1],
-                '5Y': Asset('^FVX').get_market_data_with_indicators(
-                    interval='1d',
-                    start_date=datetime.now().strftime('%Y-%m-%d'),
-                    end_date=datetime.now().strftime('%Y-%m-%d')
-                )['Close'].iloc[-1],
-                '10Y': Asset('^TNX').get_market_data_with_indicators(
-                    interval='1d',
-                    start_date=datetime.now().strftime('%Y-%m-%d'),
-                    end_date=datetime.now().strftime('%Y-%m-%d')
-                )['Close'].iloc[-1],
-                '30Y': Asset('^TYX').get_market_data_with_indicators(
-                    interval='1d',
-                    start_date=datetime.now().strftime('%Y-%m-%d'),
-                    end_date=datetime.now().strftime('%Y-%m-%d')
-                )['Close'].iloc[-1]
+                tenor: frames[symbol]['Close'].dropna().iat[-1]
+                for tenor, symbol in tenors.items()
             }
             
             # Check for inversions
             inversions = {
-                '10Y-2Y': yields['10Y'] - yields['5Y'],
+                '10Y-5Y': yields['10Y'] - yields['5Y'],
                 '30Y-10Y': yields['30Y'] - yields['10Y']
             }
             
@@ -215,11 +271,12 @@ class Market:
                 'is_inverted': any(spread < 0 for spread in inversions.values())
             }
         except Exception as e:
-            print(f"Error analyzing yield curve: {str(e)}")
+            logger.warning("Error analyzing yield curve: %s", e)
             return {}
 
 
 if __name__ == "__main__":
+    # Example usage, run from the repository root: python -m services.market
 
     # Create market analyzer with default 1-year range
     # Or specify custom date range